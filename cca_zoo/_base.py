@@ -1,4 +1,3 @@
-import itertools
 from abc import abstractmethod
 from typing import Iterable, Union, List, Optional, Any
 
@@ -149,23 +148,14 @@ class BaseModel(BaseEstimator, MultiOutputMixin, RegressorMixin):
         pairwise_correlations : numpy array of shape (n_views, n_views, latent_dimensions)
 
         """
-        transformed_views = self.transform(views, **kwargs)
-        all_corrs = []
-        for x, y in itertools.product(transformed_views, repeat=2):
-            all_corrs.append(
-                np.diag(
-                    np.corrcoef(x.T, y.T)[
-                        : self.latent_dimensions, self.latent_dimensions :
-                    ]
-                )
-            )
-        try:
-            all_corrs = np.array(all_corrs).reshape(
-                (self.n_views_, self.n_views_, self.latent_dimensions)
-            )
-        except:
-            print()
-        return all_corrs
+        transformed_views = np.stack(self.transform(views, **kwargs))
+        # Centre and normalise each score column so inner products are correlations
+        transformed_views = transformed_views - transformed_views.mean(
+            axis=1, keepdims=True
+        )
+        transformed_views /= np.linalg.norm(transformed_views, axis=1, keepdims=True)
+        # Correlation between each pair of views in each dimension
+        return np.einsum("ink,jnk->ijk", transformed_views, transformed_views)
 
     def score(
         self, views: Iterable[np.ndarray], y: Optional[Any] = None, **kwargs
@@ -48,24 +48,16 @@ class CCAEY(BaseGradientModel):
         return loss
 
     def get_AB(self, z):
-        latent_dims = z[0].shape[1]
-        A = torch.zeros(
-            latent_dims, latent_dims, device=z[0].device
-        )  # initialize the cross-covariance matrix
-        B = torch.zeros(
-            latent_dims, latent_dims, device=z[0].device
-        )  # initialize the auto-covariance matrix
-        for i, zi in enumerate(z):
-            for j, zj in enumerate(z):
-                if i == j:
-                    B += self._cross_covariance(zi, zj, latent_dims)
-                else:
-                    A += self._cross_covariance(zi, zj, latent_dims)
+        # the auto-covariance matrix is the sum of the covariances of each view
+        B = torch.stack([self._covariance(zi) for zi in z]).sum(dim=0)
+        # the sum of all pairwise covariances is the covariance of the summed scores
+        # so the cross-covariance matrix is that sum minus the auto-covariances
+        A = self._covariance(torch.stack(z).sum(dim=0)) - B
         return A / len(z), B / len(z)
 
     @staticmethod
-    def _cross_covariance(zi, zj, latent_dims) -> torch.Tensor:
-        return torch.cov(torch.hstack((zi, zj)).T)[latent_dims:, :latent_dims]
+    def _covariance(z) -> torch.Tensor:
+        return torch.atleast_2d(torch.cov(z.T))
 
     def loss(self, views, views2=None, **kwargs):
         # Encoding the views with the forward method
@@ -96,17 +88,10 @@ class CCAEY(BaseGradientModel):
 
 class PLSEY(CCAEY, PLSMixin):
     def get_AB(self, z):
-        latent_dims = z[0].shape[1]
-        A = torch.zeros(
-            latent_dims, latent_dims, device=z[0].device
-        )  # initialize the cross-covariance matrix
-        B = torch.zeros(
-            latent_dims, latent_dims, device=z[0].device
-        )  # initialize the auto-covariance matrix
-        for i, zi in enumerate(z):
-            for j, zj in enumerate(z):
-                if i == j:
-                    B += self.torch_weights[i].T @ self.torch_weights[i]
-                else:
-                    A += self._cross_covariance(zi, zj, latent_dims)
+        # the auto-covariance matrix is replaced by the sum of the weight Gram matrices
+        B = torch.stack([weight.T @ weight for weight in self.torch_weights]).sum(dim=0)
+        # the cross-covariance matrix is the covariance of the summed scores minus the covariances of each view
+        A = self._covariance(torch.stack(z).sum(dim=0)) - torch.stack(
+            [self._covariance(zi) for zi in z]
+        ).sum(dim=0)
         return A / len(z), B / len(z)
@@ -8,18 +8,10 @@ class CCAGH(CCAEY):
         return {"multiview": True, "stochastic": True}
 
     def get_AB(self, z):
-        latent_dims = z[0].shape[1]
-        A = torch.zeros(
-            latent_dims, latent_dims, device=z[0].device
-        )  # initialize the cross-covariance matrix
-        B = torch.zeros(
-            latent_dims, latent_dims, device=z[0].device
-        )  # initialize the auto-covariance matrix
-        for i, zi in enumerate(z):
-            for j, zj in enumerate(z):
-                if i == j:
-                    B += self._cross_covariance(zi, zj, latent_dims)
-                A += self._cross_covariance(zi, zj, latent_dims)
+        # the auto-covariance matrix is the sum of the covariances of each view
+        B = torch.stack([self._covariance(zi) for zi in z]).sum(dim=0)
+        # the sum of all pairwise covariances (including each view with itself) is the covariance of the summed scores
+        A = self._covariance(torch.stack(z).sum(dim=0))
         return A / len(z), B / len(z)
 
     def loss(self, views, views2=None, **kwargs):
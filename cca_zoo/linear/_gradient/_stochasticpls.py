@@ -27,5 +27,6 @@ class PLSStochasticPower(PLSEY, PLSMixin):
     @staticmethod
     def _orth(U):
         Qu, Ru = torch.linalg.qr(U)
-        Su = torch.sign(torch.sign(torch.diag(Ru)) + 0.5)
-        return Qu @ torch.diag(Su)
+        # flip columns with a negative diagonal in R, leaving zeros as positive
+        Su = torch.where(torch.diagonal(Ru) >= 0, 1.0, -1.0).to(Qu.dtype)
+        return Qu * Su
@@ -69,10 +69,7 @@ class GRCCA(MCCA):
         self.splits = np.insert(np.cumsum(self.splits), 0, 0)
 
         # Slice eigenvectors according to splits
-        self.weights = [
-            eigvecs[split:next_split]
-            for split, next_split in zip(self.splits[:-1], self.splits[1:])
-        ]
+        self.weights = np.split(eigvecs, self.splits[1:-1], axis=0)
 
         # Adjust weights for each view based on group means and mu parameters
         for i, view in enumerate(views):
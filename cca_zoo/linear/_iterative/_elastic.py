@@ -55,8 +55,14 @@ class ElasticCCA(DeflationMixin, BaseIterative):
             self.stochastic,
             self.tol,
             self.random_state,
+            self._grams,
         )
 
+    def _initialize(self, views: Iterable[np.ndarray]):
+        super()._initialize(views)
+        l1_ratio = _process_parameter("l1_ratio", self.l1_ratio, 0, self.n_views_)
+        self._grams = _precompute_grams(views, l1_ratio, self.stochastic)
+
     def _update_weights(self, views: Iterable[np.ndarray], i: int):
         # Update the weights for the current view using Elastic
         # Get the scores of all views
@@ -137,8 +143,14 @@ class SCCA_IPLS(DeflationMixin, BaseIterative):
             self.stochastic,
             self.tol,
             self.random_state,
+            self._grams,
         )
 
+    def _initialize(self, views: Iterable[np.ndarray]):
+        super()._initialize(views)
+        l1_ratio = _process_parameter("l1_ratio", self.l1_ratio, 1, self.n_views_)
+        self._grams = _precompute_grams(views, l1_ratio, self.stochastic)
+
     def _update_weights(self, views: Iterable[np.ndarray], i: int):
         # Update the weights for the current view using IPLS
         # Get the scores of all views
@@ -175,9 +187,29 @@ class SCCA_IPLS(DeflationMixin, BaseIterative):
         return objective
 
 
-def initialize_regressors(alpha, l1_ratio, positive, stochastic, tol, random_state):
+def _precompute_grams(views, l1_ratio, stochastic):
+    # The views are fixed across epochs so coordinate descent can reuse their Gram
+    # matrices. Only the Lasso and ElasticNet regressors use them and they are only
+    # worth it when there are more samples than features
+    grams = []
+    for view, ratio in zip(views, l1_ratio):
+        if stochastic or ratio == 0 or view.shape[0] <= view.shape[1]:
+            grams.append(False)
+        else:
+            # sklearn checks the Gram against the view cast to float32 or float64
+            dtype = np.float32 if view.dtype == np.float32 else np.float64
+            view = np.asarray(view, dtype=dtype)
+            grams.append(view.T @ view)
+    return grams
+
+
+def initialize_regressors(
+    alpha, l1_ratio, positive, stochastic, tol, random_state, grams=None
+):
     regressors = []
-    for alpha, l1_ratio, positive in zip(alpha, l1_ratio, positive):
+    if grams is None:
+        grams = [False] * len(alpha)
+    for alpha, l1_ratio, positive, gram in zip(alpha, l1_ratio, positive, grams):
         if stochastic:
             regressors.append(
                 SGDRegressor(
@@ -205,6 +237,7 @@ def initialize_regressors(alpha, l1_ratio, positive, stochastic, tol, random_sta
                 Lasso(
                     alpha=alpha,
                     fit_intercept=False,
+                    precompute=gram,
                     warm_start=True,
                     positive=positive,
                     random_state=random_state,
@@ -218,6 +251,7 @@ def initialize_regressors(alpha, l1_ratio, positive, stochastic, tol, random_sta
                     alpha=alpha,
                     l1_ratio=l1_ratio,
                     fit_intercept=False,
+                    precompute=gram,
                     warm_start=True,
                     positive=positive,
                     random_state=random_state,
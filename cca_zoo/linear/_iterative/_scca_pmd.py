@@ -1,4 +1,3 @@
-import itertools
 import warnings
 from typing import Union, Iterable
 
@@ -45,7 +44,8 @@ class SCCA_PMD(DeflationMixin, BaseIterative):
                 "tau parameter not set. Setting to tau=1 i.e. maximum regularisation of l1 norm"
             )
         self.tau = _process_parameter("tau", self.tau, 1, self.n_views_)
-        if any(tau < 0 or tau > 1 for tau in self.tau):
+        tau = np.asarray(self.tau)
+        if np.any((tau < 0) | (tau > 1)):
             raise ValueError(
                 "All regularisation parameters should be between 0 and 1 "
                 f"1. tau=[{self.tau}]"
@@ -54,45 +54,33 @@ class SCCA_PMD(DeflationMixin, BaseIterative):
             "positive", self.positive, False, self.n_views_
         )
 
+    def _initialize(self, views: Iterable[np.ndarray]):
+        super()._initialize(views)
+        self._scores = self.transform(views)
+
     def _update_weights(self, views: np.ndarray, i: int):
         if not hasattr(self, "t"):
             shape_sqrts = [np.sqrt(weight.shape[0]) for weight in self.weights]
             self.t = [max(1, x * y) for x, y in zip(self.tau, shape_sqrts)]
         # Update the weights for the current view using PMD
-        # Get the scores of all views
-        scores = np.stack(self.transform(views))
-        # Create a mask that is True for elements not equal to i along dim i
-        mask = np.arange(scores.shape[0]) != i
-        # Apply the mask to scores and sum along dim i
-        target = np.sum(scores[mask], axis=0)
+        # The target is the sum of the cached scores of all other views
+        target = np.sum(self._scores, axis=0) - self._scores[i]
         # Compute the new weights by multiplying the view with the target
         new_weights = views[i].T @ target
         if self.positive[i]:
             # If positive is true, set all negative values to 0
-            new_weights[new_weights < 0] = 0
+            np.maximum(new_weights, 0, out=new_weights)
         # Apply the delta search function to the new weights with the regularization parameter
         new_weights = _delta_search(new_weights, self.t[i], tol=self.tol)
+        # Only the scores of the current view change with its weights
+        self._scores[i] = views[i] @ new_weights
         # Return the new weights
         return new_weights
 
     def _objective(self, views: Iterable[np.ndarray]):
         # Compute the objective function value for a given set of views using SCCA
-        # Get the scores of all views
-        transformed_views = self.transform(views)
-        all_covs = []
-        # Sum all the pairwise covariances except self covariance
-        for x, y in itertools.product(transformed_views, repeat=2):
-            all_covs.append(
-                np.diag(
-                    np.corrcoef(x.T, y.T)[
-                        : self.latent_dimensions, self.latent_dimensions :
-                    ]
-                )
-            )
-        # the sum of covariances
-        return np.sum(all_covs) - np.sum(
-            [
-                self.tau[i] * np.linalg.norm(self.weights[i])
-                for i in range(len(self.weights))
-            ]
-        )
+        # Get the per-component correlations between all pairs of views
+        all_corrs = self.pairwise_correlations(views)
+        # the sum of correlations minus the weighted norms of the weights
+        norms = [np.linalg.norm(weight) for weight in self.weights]
+        return np.sum(all_corrs) - np.dot(self.tau, norms)
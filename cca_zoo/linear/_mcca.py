@@ -1,7 +1,8 @@
+import itertools
 from typing import Iterable, Union
 
 import numpy as np
-from scipy.linalg import block_diag, eigh
+from scipy.linalg import cholesky, eigh, eigvalsh, solve_triangular
 from sklearn.decomposition import PCA
 
 from cca_zoo._base import BaseModel
@@ -109,12 +110,24 @@ class MCCA(BaseModel):
         # Solve the eigenvalue problem
         # Get the dimension of _C
         p = C.shape[0]
-        # Solve the generalized eigenvalue problem Cx=lambda Dx using a subset of eigenvalues and eigenvectors
-        [eigvals, eigvecs] = eigh(
-            C,
-            D,
-            subset_by_index=[p - self.latent_dimensions, p - 1],
-        )
+        if D is None:
+            # Solve the standard eigenvalue problem Cx=lambda x using a subset of eigenvalues and eigenvectors
+            [eigvals, eigvecs] = eigh(
+                C,
+                subset_by_index=[p - self.latent_dimensions, p - 1],
+            )
+        else:
+            # Solve the generalized eigenvalue problem Cx=lambda Dx by whitening with the Cholesky factor D=LL^T
+            L = cholesky(D, lower=True)
+            M = solve_triangular(L, solve_triangular(L, C, lower=True).T, lower=True)
+            [eigvals, eigvecs] = eigh(
+                M,
+                subset_by_index=[p - self.latent_dimensions, p - 1],
+                overwrite_a=True,
+                check_finite=False,
+            )
+            # Map the eigenvectors back from the whitened space
+            eigvecs = solve_triangular(L, eigvecs, lower=True, trans="T")
         # Sort the eigenvalues and eigenvectors in descending order
         idx = np.argsort(eigvals, axis=0)[::-1]
         eigvecs = eigvecs[:, idx].real
@@ -139,30 +152,32 @@ class MCCA(BaseModel):
         return [self.pca_models[i].fit_transform(view) for i, view in enumerate(views)]
 
     def _C(self, views, **kwargs):
-        all_views = np.hstack(views)
-        C = np.cov(all_views, rowvar=False)
-        C -= block_diag(*[np.cov(view, rowvar=False) for view in views])
+        # Only the cross-covariance blocks between different views are nonzero
+        # centre in float64 like np.cov so low precision views cannot overflow
+        views = [view - view.mean(axis=0, dtype=np.float64) for view in views]
+        splits = np.cumsum([0] + [view.shape[1] for view in views])
+        C = np.zeros((splits[-1], splits[-1]))
+        for i, j in itertools.combinations(range(len(views)), 2):
+            C_ij = views[i].T @ views[j] / (views[i].shape[0] - 1)
+            C[splits[i] : splits[i + 1], splits[j] : splits[j + 1]] = C_ij
+            C[splits[j] : splits[j + 1], splits[i] : splits[i + 1]] = C_ij.T
         return C / len(views)
 
     def _D(self, views, **kwargs):
-        if self.pca:
-            # Can regularise by adding to diagonal
-            D = block_diag(
-                *[
-                    np.diag((1 - self.c[i]) * pc.explained_variance_ + self.c[i])
-                    for i, pc in enumerate(self.pca_models)
-                ]
-            )
-        else:
-            D = block_diag(
-                *[
-                    (1 - self.c[i]) * np.cov(view, rowvar=False)
-                    + self.c[i] * np.eye(view.shape[1])
-                    for i, view in enumerate(views)
-                ]
-            )
-        D_smallest_eig = min(0, np.linalg.eigvalsh(D).min()) - self.eps
-        D = D - D_smallest_eig * np.eye(D.shape[0])
+        # Write each view's block straight into the block diagonal matrix
+        splits = np.cumsum([0] + [view.shape[1] for view in views])
+        D = np.zeros((splits[-1], splits[-1]))
+        blocks = _diagonal_blocks(D, splits)
+        for i, (view, block) in enumerate(zip(views, blocks)):
+            if self.pca:
+                # Can regularise by adding to diagonal
+                variance = self.pca_models[i].explained_variance_
+                np.fill_diagonal(block, (1 - self.c[i]) * variance + self.c[i])
+            else:
+                block[:] = (1 - self.c[i]) * np.cov(view, rowvar=False)
+                block[np.diag_indices_from(block)] += self.c[i]
+        D_smallest_eig = min(0, _smallest_eigenvalue(blocks)) - self.eps
+        D[np.diag_indices_from(D)] -= D_smallest_eig
         return D / len(views)
 
     def _more_tags(self):
@@ -170,6 +185,20 @@ class MCCA(BaseModel):
         return {"multiview": True}
 
 
+def _diagonal_blocks(D, splits):
+    """
+    Views of the diagonal blocks of D delimited by the cumulative sizes in splits
+    """
+    return [D[start:end, start:end] for start, end in zip(splits[:-1], splits[1:])]
+
+
+def _smallest_eigenvalue(blocks):
+    """
+    Smallest eigenvalue of the block diagonal matrix with the given symmetric blocks
+    """
+    return min(eigvalsh(block, subset_by_index=[0, 0])[0] for block in blocks)
+
+
 class rCCA(MCCA):
     r"""
     A class used to fit Regularised CCA (canonical ridge) model. This model adds a regularization term to the CCA objective function to avoid overfitting and improve stability. It uses PCA to perform the optimization efficiently for high dimensional data.
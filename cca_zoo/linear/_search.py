@@ -1,8 +1,7 @@
 import numpy as np
-from scipy.optimize import minimize
 
 
-def _delta_search(w, c, tol=1e-8):
+def _delta_search(w, c, tol=1e-8, max_iter=100):
     """
     Searches for threshold delta such that the 1-norm of weights w is less than or equal to c and the 2-norm is equal to 1.
     Parameters
@@ -11,8 +10,10 @@ def _delta_search(w, c, tol=1e-8):
         weights found by one power method iteration
     c : float
         1-norm threshold
-    init : float, optional
-        initial value for delta (default is 0)
+    tol : float, optional
+        tolerance on how far below c the 1-norm may be (default is 1e-8)
+    max_iter : int, optional
+        maximum number of bisection steps (default is 100)
 
     Returns
     -------
@@ -22,54 +23,42 @@ def _delta_search(w, c, tol=1e-8):
     """
     # First normalize the weights to unit length
     w = w / np.linalg.norm(w)
-
-    # Define a scalar function that returns the difference between the 1-norm of coefficients and the threshold c
-    def f(delta):
-        # Apply soft thresholding to the weights with delta
-        coef = np.clip(w - delta, 0, None) - np.clip(-w - delta, 0, None)
-
-        if np.sum(coef**2) == 0:
-            coef[:] = 1000
+    abs_w = np.abs(w)
+
+    # No thresholding needed if the weights are already inside the 1-norm ball
+    if np.sum(abs_w) <= c:
+        return w
+
+    # A unit vector has 1-norm at least 1 so below that only the largest weight is kept
+    if c < 1:
+        coef = np.zeros_like(w)
+        coef[np.argmax(abs_w)] = 1
+        return np.sign(w) * coef
+
+    # The 1-norm of the normalized soft thresholded weights decreases with delta
+    # so we can bisect on delta between 0 and the largest absolute weight.
+    # The upper end of the interval always satisfies the 1-norm bound
+    lower, upper = 0.0, abs_w.max()
+    for _ in range(max_iter):
+        delta = (lower + upper) / 2
+        l1 = np.sum(_soft_threshold(abs_w, delta))
+        if l1 > c:
+            lower = delta
         else:
-            # Normalize the coefficients to unit length if nonzero
-            coef /= np.linalg.norm(coef)
-
-        # Return the square of the difference between the 1-norm of coefficients and the threshold c
-        return (np.sum(np.abs(coef)) - c) ** 2
-
-    # Find the minimum of f using scipy minimization function
-    # You can specify the method or let the function choose the best one for you
-    # You can also pass other parameters like tol, maxiter, etc.
-    # bound x to be between 0 and 1
-
-    # try some different methods until one gets result.success == True
-    result = minimize(f, x0=0, bounds=[(0, 1)], method="L-BFGS-B", tol=tol)
-    if not result.success:
-        result = minimize(f, x0=0, bounds=[(0, 1)], method="TNC", tol=tol)
-    if not result.success:
-        result = minimize(f, x0=0, bounds=[(0, 1)], method="SLSQP", tol=tol)
-    if not result.success:
-        result = minimize(f, x0=0, bounds=[(0, 1)], method="trust-constr", tol=tol)
-
-    # Check if the solution is valid and converged
-    if result.success:
-        # Get the optimal delta from the result object
-        delta = result.x
-
-        # Apply soft thresholding to the weights with optimal delta
-        coef = np.where(w - delta > 0, w - delta, 0) - np.where(
-            -w - delta > 0, -w - delta, 0
-        )
+            upper = delta
+            if c - l1 < tol:
+                break
+        if upper - lower < 1e-12:
+            break
 
-        # Normalize the coefficients to unit length if nonzero
-        coef /= np.linalg.norm(coef)
+    # Return updated weights with the original signs
+    return np.sign(w) * _soft_threshold(abs_w, upper)
 
-        # Return updated weights
-        return coef
 
-    else:
-        # Raise an exception if no solution was found
-        raise ValueError("No root was found for f")
+def _soft_threshold(abs_w, delta):
+    # Apply soft thresholding to the weights with delta and normalize to unit length
+    coef = np.maximum(abs_w - delta, 0)
+    return coef / np.linalg.norm(coef)
 
 
 def support_threshold(data, support, **kwargs):
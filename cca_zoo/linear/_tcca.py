@@ -2,7 +2,6 @@ from typing import Iterable
 
 import numpy as np
 import tensorly as tl
-from scipy.linalg import sqrtm
 from tensorly.decomposition import parafac
 
 from cca_zoo.linear._mcca import MCCA
@@ -43,28 +42,23 @@ class TCCA(MCCA):
         views = self._validate_data(views)
         self._check_params()
         # returns whitened views along with whitening matrices
-        whitened_views, covs_invsqrt = self._setup_tensor(views)
+        whitened_views, whitenings = self._setup_tensor(views)
         # The idea here is to form a matrix with M dimensions one for each view where at index
-        # M[p_i,p_j,p_k...] we have the sum over n samples of the product of the pth feature of the
-        # ith, jth, kth view etc.
-        for i, el in enumerate(whitened_views):
-            # To achieve this we start with the first view so M is nxp.
-            if i == 0:
-                M = el
-            # For the remaining views we expand their dimensions to match M i.e. nx1x...x1xp
-            else:
-                for _ in range(len(M.shape) - 1):
-                    el = np.expand_dims(el, 1)
-                # Then we perform an outer product by expanding the dimensionality of M and
-                # outer product with the expanded el
-                M = np.expand_dims(M, -1) @ el
-        M = np.mean(M, 0)
+        # M[p_i,p_j,p_k...] we have the mean over n samples of the product of the pth feature of the
+        # ith, jth, kth view etc. einsum contracts over the samples directly so the
+        # n x p_i x p_j x ... tensor of per-sample outer products is never formed.
+        subscripts = [chr(ord("a") + i) for i in range(len(whitened_views))]
+        subscripts = ",".join(f"z{s}" for s in subscripts) + "->" + "".join(subscripts)
+        M = np.einsum(subscripts, *whitened_views, optimize=True)
+        M /= views[0].shape[0]
         tl.set_backend("numpy")
-        M_parafac = parafac(M, self.latent_dimensions, verbose=False)
+        M_parafac = parafac(
+            M, self.latent_dimensions, verbose=False, random_state=self.random_state
+        )
         self.weights = [
-            cov_invsqrt @ fac
-            for i, (view, cov_invsqrt, fac) in enumerate(
-                zip(whitened_views, covs_invsqrt, M_parafac.factors)
+            whitening @ fac
+            for i, (view, whitening, fac) in enumerate(
+                zip(whitened_views, whitenings, M_parafac.factors)
             )
         ]
         return self
@@ -103,24 +97,43 @@ class TCCA(MCCA):
         return dim_corrs
 
     def _setup_tensor(self, views: Iterable[np.ndarray], **kwargs):
-        covs = [
-            (1 - self.c[i]) * np.cov(view, rowvar=False)
-            + self.c[i] * np.eye(view.shape[1])
-            for i, view in enumerate(views)
+        whitenings = [
+            _whitening(view, self.c[i], self.eps) for i, view in enumerate(views)
         ]
-        smallest_eigs = [
-            min(0, np.linalg.eigvalsh(cov).min()) - self.eps for cov in covs
-        ]
-        covs = [
-            cov - smallest_eig * np.eye(cov.shape[0])
-            for cov, smallest_eig in zip(covs, smallest_eigs)
-        ]
-        covs_invsqrt = [np.linalg.inv(sqrtm(cov).real) for cov in covs]
         views = [
-            train_view @ cov_invsqrt
-            for train_view, cov_invsqrt in zip(views, covs_invsqrt)
+            train_view @ whitening for train_view, whitening in zip(views, whitenings)
         ]
-        return views, covs_invsqrt
+        return views, whitenings
 
     def _more_tags(self):
         return {"multiview": True}
+
+
+def _whitening(view, c, eps):
+    """
+    Whitening matrix W with W @ W.T equal to the inverse of the regularised covariance
+    (1-c)*cov(view) + c*I, shifted by its smallest eigenvalue when that is negative.
+
+    The covariance is only decomposed once and the regularisation is applied to its
+    eigenvalues. W is the scaled eigenvector basis rather than the symmetric inverse
+    square root, which saves multiplying back by the eigenvectors. When there are fewer
+    samples than features the eigenvectors come from a thin SVD of the centred view and
+    the remaining directions all have eigenvalue c, so the symmetric inverse square root
+    is formed instead.
+    """
+    n, p = view.shape
+    # centre in float64 like np.cov so low precision views can be decomposed
+    view = view - view.mean(axis=0, dtype=np.float64)
+    if n < p:
+        _, s, Vt = np.linalg.svd(view, full_matrices=False)
+        eigvals, eigvecs = s**2 / (n - 1), Vt.T
+    else:
+        eigvals, eigvecs = np.linalg.eigh(view.T @ view / (n - 1))
+    eigvals = (1 - c) * eigvals + c
+    if eigvecs.shape[1] == p:
+        shift = min(0, eigvals.min()) - eps
+        return eigvecs / np.sqrt(eigvals - shift)
+    shift = min(0, eigvals.min(), c) - eps
+    whitening = (eigvecs / np.sqrt(eigvals - shift)) @ eigvecs.T
+    whitening += (np.eye(p) - eigvecs @ eigvecs.T) / np.sqrt(c - shift)
+    return whitening
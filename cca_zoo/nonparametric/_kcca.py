@@ -1,12 +1,11 @@
 from typing import Iterable, Union
 
 import numpy as np
-from scipy.linalg import block_diag
 from sklearn.metrics import pairwise_kernels
 from sklearn.utils.validation import check_is_fitted
 
 from cca_zoo.linear._gcca import GCCA
-from cca_zoo.linear._mcca import MCCA
+from cca_zoo.linear._mcca import MCCA, _diagonal_blocks, _smallest_eigenvalue
 from cca_zoo.linear._tcca import TCCA
 from cca_zoo.utils import _process_parameter
 
@@ -22,35 +21,62 @@ class KernelMixin:
             "kernel_params", self.kernel_params, {}, self.n_views_
         )
 
+    def _get_kernel(self, i, X, Y=None):
+        kernel, gamma = self.kernel[i], self.gamma[i]
+        if (
+            kernel in ("linear", "rbf", "poly", "polynomial")
+            and not self.kernel_params[i]
+        ):
+            # Compute the common kernels directly to skip sklearn's metric dispatch
+            # Like sklearn only keep float32 when both inputs are float32
+            if X.dtype == np.float32 and (Y is None or Y.dtype == np.float32):
+                dtype = np.float32
+            else:
+                dtype = np.float64
+            X = X.astype(dtype, copy=False)
+            if Y is not None:
+                Y = Y.astype(dtype, copy=False)
+            K = X @ (X if Y is None else Y).T
+            if kernel == "linear":
+                return K
+            if gamma is None:
+                gamma = 1.0 / X.shape[1]
+            if kernel == "rbf":
+                # squared euclidean distances from the inner products
+                X_norms = np.einsum("ij,ij->i", X, X)
+                Y_norms = X_norms if Y is None else np.einsum("ij,ij->i", Y, Y)
+                K *= -2
+                K += X_norms[:, None]
+                K += Y_norms[None, :]
+                np.maximum(K, 0, out=K)
+                if Y is None:
+                    np.fill_diagonal(K, 0)
+                K *= -gamma
+                return np.exp(K, out=K)
+            if kernel in ("poly", "polynomial"):
+                K *= gamma
+                K += self.coef0[i]
+                return K ** self.degree[i]
+        return pairwise_kernels(
+            X,
+            Y=Y,
+            metric=kernel,
+            gamma=gamma,
+            degree=self.degree[i],
+            coef0=self.coef0[i],
+            filter_params=True,
+            **self.kernel_params[i]
+        )
+
     def _process_data(self, views, K=None):
         self.train_views = views
-        kernels = [
-            pairwise_kernels(
-                view,
-                metric=self.kernel[i],
-                gamma=self.gamma[i],
-                degree=self.degree[i],
-                coef0=self.coef0[i],
-                filter_params=True,
-                **self.kernel_params[i]
-            )
-            for i, view in enumerate(self.train_views)
-        ]
+        kernels = [self._get_kernel(i, view) for i, view in enumerate(self.train_views)]
         return kernels
 
     def transform(self, views: Iterable[np.ndarray], **kwargs):
         check_is_fitted(self, attributes=["alphas"])
         Ktest = [
-            pairwise_kernels(
-                self.train_views[i],
-                Y=view,
-                metric=self.kernel[i],
-                gamma=self.gamma[i],
-                degree=self.degree[i],
-                coef0=self.coef0[i],
-                filter_params=True,
-                **self.kernel_params[i]
-            )
+            self._get_kernel(i, self.train_views[i], Y=view)
             for i, view in enumerate(views)
         ]
         transformed_views = [
@@ -150,14 +176,15 @@ class KCCA(KernelMixin, MCCA):
         self.degree = degree
 
     def _D(self, views, **kwargs):
-        D = block_diag(
-            *[
-                (1 - self.c[i]) * np.cov(view, rowvar=False) + self.c[i] * view
-                for i, view in enumerate(views)
-            ]
-        )
-        D_smallest_eig = min(0, np.linalg.eigvalsh(D).min()) - self.eps
-        D = D - D_smallest_eig * np.eye(D.shape[0])
+        # Write each kernel's block straight into the block diagonal matrix
+        splits = np.cumsum([0] + [view.shape[1] for view in views])
+        D = np.zeros((splits[-1], splits[-1]))
+        blocks = _diagonal_blocks(D, splits)
+        for i, (view, block) in enumerate(zip(views, blocks)):
+            block[:] = (1 - self.c[i]) * np.cov(view, rowvar=False)
+            block += self.c[i] * view
+        D_smallest_eig = min(0, _smallest_eigenvalue(blocks)) - self.eps
+        D[np.diag_indices_from(D)] -= D_smallest_eig
         return D / len(views)
 
 
@@ -246,18 +273,7 @@ class KGCCA(KernelMixin, GCCA):
         self.degree = degree
 
     def _weights(self, eigvals, eigvecs, views, **kwargs):
-        kernels = [
-            pairwise_kernels(
-                view,
-                metric=self.kernel[i],
-                gamma=self.gamma[i],
-                degree=self.degree[i],
-                coef0=self.coef0[i],
-                filter_params=True,
-                **self.kernel_params[i]
-            )
-            for i, view in enumerate(self.train_views)
-        ]
+        kernels = [self._get_kernel(i, view) for i, view in enumerate(self.train_views)]
         self.weights = [
             np.linalg.pinv(kernel) @ eigvecs[:, : self.latent_dimensions]
             for kernel in kernels
@@ -324,16 +340,5 @@ class KTCCA(KernelMixin, TCCA):
 
     def _setup_tensor(self, views: Iterable[np.ndarray], **kwargs):
         self.train_views = views
-        kernels = [
-            pairwise_kernels(
-                view,
-                metric=self.kernel[i],
-                gamma=self.gamma[i],
-                degree=self.degree[i],
-                coef0=self.coef0[i],
-                filter_params=True,
-                **self.kernel_params[i]
-            )
-            for i, view in enumerate(self.train_views)
-        ]
+        kernels = [self._get_kernel(i, view) for i, view in enumerate(self.train_views)]
         return super()._setup_tensor(kernels)
@@ -63,9 +63,9 @@ class CovarianceHeatmapDisplay:
             test_scores = model.transform(test_views)
         else:
             test_scores = None
-        train_covariances = np.cov(train_scores[0].T, train_scores[1].T)
+        train_covariances = _covariance(train_scores[0], train_scores[1])
         if test_scores is not None:
-            test_covariances = np.cov(test_scores[0].T, test_scores[1].T)
+            test_covariances = _covariance(test_scores[0], test_scores[1])
         else:
             test_covariances = None
         return cls.from_covariances(train_covariances, test_covariances)
@@ -94,3 +94,10 @@ class CovarianceHeatmapDisplay:
         plt.tight_layout()
         self.figure_ = fig
         return self
+
+
+def _covariance(*scores):
+    # same as np.cov of the concatenated scores but as a single centred Gram product
+    Z = np.hstack(scores)
+    Z -= Z.mean(axis=0)
+    return Z.T @ Z / (Z.shape[0] - 1)
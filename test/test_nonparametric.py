@@ -4,6 +4,8 @@ Test the kernel methods
 
 import numpy as np
 import pytest
+from sklearn.metrics import pairwise_kernels
+
 from cca_zoo.linear import GCCA, MCCA, TCCA
 from cca_zoo.nonparametric import KCCA, KGCCA, KTCCA, NCCA
 
@@ -39,6 +41,40 @@ def test_kernel_types(kernel, data):
         assert instance is not None, f"Failed for model {model} with kernel {kernel}"
 
 
+@pytest.mark.parametrize("kernel", ["linear", "rbf", "poly"])
+@pytest.mark.parametrize("gamma", [None, 0.5])
+@pytest.mark.parametrize("test_view", [False, True])
+@pytest.mark.parametrize("dtype", [np.float16, np.float32, np.float64])
+def test_kernel_matches_pairwise_kernels(kernel, gamma, test_view, dtype, data):
+    X, Y, Z = data
+    model = KCCA(latent_dimensions=2, kernel=kernel, gamma=gamma, degree=2, coef0=0.5)
+    model.fit((X, Y))
+    X = X.astype(dtype)
+    X_test = Z[:20].astype(dtype) if test_view else None
+    K = model._get_kernel(0, X, X_test)
+    expected = pairwise_kernels(
+        X,
+        Y=X_test,
+        metric=kernel,
+        gamma=gamma,
+        degree=2,
+        coef0=0.5,
+        filter_params=True,
+    )
+    assert K.dtype == expected.dtype, f"Kernel {kernel} dtype differs from sklearn"
+    rtol = 1e-4 if dtype == np.float32 else 1e-5
+    assert np.allclose(K, expected, rtol=rtol), f"Kernel {kernel} differs from sklearn"
+
+
+@pytest.mark.parametrize("dtype", [np.float16, np.float32])
+def test_kcca_low_precision(dtype, data):
+    X, Y, Z = data
+    # large enough that the kernel covariances overflow float16
+    views = ((10 * X).astype(dtype), (10 * Y).astype(dtype))
+    kcca = KCCA(latent_dimensions=3, c=0.1).fit(views)
+    assert np.all(np.isfinite(kcca.score(views))), f"Failed for dtype {dtype}"
+
+
 def test_callable_kernel(data):
     X, Y, Z = data
 
@@ -22,6 +22,7 @@ from cca_zoo.linear import (
     rCCA,
 )
 from cca_zoo.linear._dummy import DummyCCA
+from cca_zoo.linear._search import _delta_search
 from cca_zoo.model_selection import GridSearchCV, RandomizedSearchCV
 from cca_zoo.nonparametric import KCCA
 
@@ -236,3 +237,35 @@ def test_deflation():
         )
         is None
     )
+
+
+def test_elastic_low_precision():
+    for dtype in [np.float16, np.float32]:
+        views = [X.astype(dtype), Y.astype(dtype)]
+        for model in [
+            ElasticCCA(alpha=1e-3, l1_ratio=0.5, epochs=5),
+            SCCA_IPLS(alpha=1e-3, epochs=5),
+        ]:
+            model.fit(views)
+            assert np.all(np.isfinite(model.score(views)))
+
+
+def test_delta_search():
+    w = rng.randn(20)
+    # weights outside the 1-norm ball are thresholded onto its boundary
+    for c in [1.5, 3]:
+        out = _delta_search(w, c)
+        assert np.isclose(np.linalg.norm(out), 1)
+        assert c - 1e-6 <= np.abs(out).sum() <= c
+        assert np.all(np.sign(out[out != 0]) == np.sign(w[out != 0]))
+    # tol bounds how far below c the 1-norm can land
+    out = _delta_search(rng.randn(50), 5, tol=1e-3)
+    assert 5 - 1e-3 <= np.abs(out).sum() <= 5
+    # normalised weights already inside the 1-norm ball are returned unchanged
+    out = _delta_search(w, 10)
+    assert np.allclose(out, w / np.linalg.norm(w))
+    # below 1 the ball cannot be reached so only the largest weight survives
+    out = _delta_search(w, 0.5)
+    assert np.isclose(np.linalg.norm(out), 1)
+    assert np.count_nonzero(out) == 1
+    assert np.argmax(np.abs(out)) == np.argmax(np.abs(w))
@@ -91,3 +91,26 @@ def test_TCCA_methods(data):
 
     assert corr_tcca > 0.1
     assert corr_ktcca > 0.1
+
+
+@pytest.mark.parametrize("dtype", [np.float16, np.float32])
+def test_TCCA_low_precision(dtype, data):
+    """Test that TCCA and KTCCA whiten low precision views in float64."""
+    X, Y, _, _, _ = data
+    views = [X.astype(dtype), Y.astype(dtype)]
+    for model in [TCCA(c=[0.2, 0.2]), KTCCA(c=[0.2, 0.2])]:
+        model.fit(views)
+        assert all(weights.dtype == np.float64 for weights in model.weights)
+        assert np.all(np.isfinite(model.score(views)))
+
+
+def test_MCCA_low_precision(data):
+    """Test that MCCA solves low precision views in float64."""
+    X, Y, _, _, _ = data
+    views = [X.astype(np.float16), Y.astype(np.float16)]
+    upcast_views = [view.astype(np.float64) for view in views]
+    mcca = MCCA(latent_dimensions=2, pca=False).fit(views)
+    mcca_upcast = MCCA(latent_dimensions=2, pca=False).fit(upcast_views)
+    assert np.allclose(
+        mcca.score(upcast_views), mcca_upcast.score(upcast_views), rtol=0, atol=1e-10
+    )